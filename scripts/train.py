@@ -2,24 +2,22 @@ import os
 import sys
 
 import joblib
-import matplotlib.pyplot as plt
 import mlflow
 import mlflow.sklearn
 import pandas as pd
+import yaml
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import (
-    auc,
-    f1_score,
-    precision_recall_curve,
-    precision_score,
-    recall_score,
-    roc_auc_score,
-)
 from sklearn.model_selection import train_test_split
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from src.churn_predictor.evaluation import (  # noqa: E402
+    compute_metrics,
+    cross_validate,
+    plot_pr_curve,
+)
+
 # Define paths for the new model
 DATA_PATH = "data/processed_user_features.csv"
 ARTIFACTS_DIR = "ml_artifacts"
@@ -28,6 +26,9 @@ MODEL_PATH = os.path.join(
 )  # <-- Updated model name
 FEATURES_PATH = os.path.join(ARTIFACTS_DIR, "feature_list.joblib")
 
+CONFIG_PATH = "configs/config.yaml"
+PR_CURVE_PATH = "pr_curve.png"
+
 
 def main():
     """
@@ -36,6 +37,10 @@ def main():
     """
     print("Starting model training with RandomForestClassifier...")
 
+    with open(CONFIG_PATH, "r") as f:
+        config = yaml.safe_load(f)
+    eval_config = config["evaluation"]
+
     os.makedirs(ARTIFACTS_DIR, exist_ok=True)
     df = pd.read_csv(DATA_PATH)
 
@@ -68,46 +73,37 @@ def main():
         mlflow.log_param("model_type", "RandomForestClassifier")
         mlflow.log_params(model.get_params())
 
+        # Cross-validate in parallel processes before fitting the final model
+        cv_report = cross_validate(
+            model,
+            X,
+            y,
+            n_splits=eval_config["cv_folds"],
+            n_jobs=eval_config["n_jobs"],
+            random_state=config["training"]["random_state"],
+        )
+        mlflow.log_metrics({f"CV_{k}_mean": v for k, v in cv_report["mean"].items()})
+        mlflow.log_metrics({f"CV_{k}_std": v for k, v in cv_report["std"].items()})
+        print(f"{eval_config['cv_folds']}-fold CV Metrics (mean):", cv_report["mean"])
+
         # Train the model
         model.fit(X_train, y_train)
 
         # Evaluate model performance
         y_pred_proba = model.predict_proba(X_val)[:, 1]
-        y_pred = model.predict(X_val)
-
-        auc_roc = roc_auc_score(y_val, y_pred_proba)
-        f1 = f1_score(y_val, y_pred)
-        precision = precision_score(y_val, y_pred)
-        recall = recall_score(y_val, y_pred)
-
-        metrics = {
-            "AUC_ROC": auc_roc,
-            "F1_Score": f1,
-            "Precision": precision,
-            "Recall": recall,
-        }
+        metrics, pr_curve = compute_metrics(y_val, y_pred_proba, return_curve=True)
         mlflow.log_metrics(metrics)
         print("Evaluation Metrics:", metrics)
 
-        # Log Precision-Recall curve
-        precision_vals, recall_vals, _ = precision_recall_curve(y_val, y_pred_proba)
-        pr_auc = auc(recall_vals, precision_vals)
-        mlflow.log_metric("PR_AUC", pr_auc)
-
-        fig, ax = plt.subplots()
-        ax.plot(recall_vals, precision_vals, label=f"PR AUC = {pr_auc:.2f}")
-        ax.set_title("Precision-Recall Curve")
-        ax.set_xlabel("Recall")
-        ax.set_ylabel("Precision")
-        ax.legend()
-        plt.savefig("pr_curve.png")
-        mlflow.log_artifact("pr_curve.png")
-        plt.close()
-
         # Log and save the trained model
         mlflow.sklearn.log_model(model, "model")
         joblib.dump(model, MODEL_PATH)
 
+        # Log Precision-Recall curve (optional, runs after the model is saved)
+        if eval_config["plot_pr_curve"]:
+            plot_pr_curve(pr_curve, metrics["PR_AUC"], PR_CURVE_PATH)
+            mlflow.log_artifact(PR_CURVE_PATH)
+
     print(f"Model training complete. Model saved to {MODEL_PATH}")
 
 
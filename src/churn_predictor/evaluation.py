@@ -0,0 +1,198 @@
+import numpy as np
+import pandas as pd
+from joblib import Parallel, cpu_count, delayed
+from sklearn.base import clone
+from sklearn.model_selection import StratifiedKFold
+
+
+def _ranked_counts(y_true, y_score):
+    """
+    Sorts the scores once and returns the cumulative true/false positive counts
+    at every distinct threshold, from the highest score to the lowest.
+    """
+    y_true = np.asarray(y_true).astype(int).ravel()
+    y_score = np.asarray(y_score, dtype=float).ravel()
+
+    order = np.argsort(-y_score, kind="mergesort")
+    y_score = y_score[order]
+    y_true = y_true[order]
+
+    # Indices of the last occurrence of each distinct score
+    distinct_idx = np.where(np.diff(y_score))[0]
+    threshold_idx = np.r_[distinct_idx, y_true.size - 1]
+
+    tps = np.cumsum(y_true)[threshold_idx]
+    fps = (threshold_idx + 1) - tps
+    return tps, fps, y_score[threshold_idx], y_score
+
+
+def _safe_divide(numerator, denominator):
+    """Element-wise division that yields 0.0 where the denominator is 0."""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    out = np.zeros_like(numerator, dtype=float)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+def _trapezoid(y, x):
+    """Area under the curve using the trapezoidal rule."""
+    return np.sum(np.diff(x) * (y[1:] + y[:-1]) / 2)
+
+
+def compute_metrics(y_true, y_score, threshold=0.5, return_curve=False):
+    """
+    Computes all threshold-dependent metrics from a single sort of the scores.
+
+    Args:
+        y_true: Binary ground-truth labels.
+        y_score: Predicted probabilities for the positive class.
+        threshold (float): Decision threshold; a sample is predicted positive
+            when its score is strictly greater than the threshold.
+        return_curve (bool): Whether to also return the precision-recall curve.
+
+    Returns:
+        dict: ROC-AUC, PR-AUC, F1, precision and recall at ``threshold``, plus the
+            F1-optimal threshold found by sweeping every distinct score, expressed
+            with the same "score > threshold" rule.
+            If ``return_curve`` is True, a ``(metrics, curve)`` tuple is returned
+            where ``curve`` holds ``precision``, ``recall`` and ``thresholds``.
+    """
+    tps, fps, thresholds, sorted_scores = _ranked_counts(y_true, y_score)
+    n_pos, n_neg = tps[-1], fps[-1]
+    if n_pos == 0 or n_neg == 0:
+        raise ValueError("Both classes must be present in y_true to compute metrics.")
+
+    # ROC curve and AUC
+    tpr = np.r_[0, tps] / n_pos
+    fpr = np.r_[0, fps] / n_neg
+    auc_roc = _trapezoid(tpr, fpr)
+
+    # Precision-recall curve, anchored at (recall=0, precision=1)
+    precision_vals = np.r_[1.0, _safe_divide(tps, tps + fps)]
+    recall_vals = np.r_[0.0, tps / n_pos]
+    pr_auc = _trapezoid(precision_vals, recall_vals)
+
+    # Metrics at the fixed decision threshold (score > threshold)
+    n_predicted = np.searchsorted(-sorted_scores, -threshold, side="left")
+    if n_predicted:
+        # Number of distinct-score groups fully above the threshold
+        group = np.searchsorted(-thresholds, -threshold, side="left") - 1
+        tp = tps[group]
+    else:
+        tp = 0
+    precision = tp / n_predicted if n_predicted else 0.0
+    recall = tp / n_pos
+    f1 = 2 * tp / (n_predicted + n_pos)
+
+    # Optimal-threshold sweep. Predicting the top i + 1 score groups positive under
+    # the same "score > threshold" rule needs a cut-off at the next-lower distinct
+    # score, or just below the lowest score for the last group.
+    f1_sweep = 2 * tps / (tps + fps + n_pos)
+    best = int(np.argmax(f1_sweep))
+    cutoffs = np.r_[thresholds[1:], np.nextafter(thresholds[-1], -np.inf)]
+
+    metrics = {
+        "AUC_ROC": float(auc_roc),
+        "PR_AUC": float(pr_auc),
+        "F1_Score": float(f1),
+        "Precision": float(precision),
+        "Recall": float(recall),
+        "Best_Threshold": float(cutoffs[best]),
+        "Best_F1_Score": float(f1_sweep[best]),
+    }
+    if return_curve:
+        curve = {
+            "precision": precision_vals,
+            "recall": recall_vals,
+            "thresholds": thresholds,
+        }
+        return metrics, curve
+    return metrics
+
+
+def _fit_and_score(estimator, X, y, train_idx, val_idx, threshold, fit):
+    """Fits a fresh copy of the estimator on one fold and scores its holdout."""
+    model = clone(estimator)
+    if fit is None:
+        model.fit(X.iloc[train_idx], y.iloc[train_idx])
+    else:
+        fit(model, X.iloc[train_idx], y.iloc[train_idx])
+    y_score = model.predict_proba(X.iloc[val_idx])[:, 1]
+    return compute_metrics(y.iloc[val_idx], y_score, threshold=threshold)
+
+
+def cross_validate(
+    estimator,
+    X: pd.DataFrame,
+    y: pd.Series,
+    n_splits=5,
+    n_jobs=-1,
+    random_state=42,
+    threshold=0.5,
+    fit=None,
+) -> dict:
+    """
+    Runs stratified k-fold cross-validation with each fold in its own process.
+
+    Args:
+        estimator: An unfitted scikit-learn compatible classifier.
+        X (pd.DataFrame): The feature matrix.
+        y (pd.Series): The binary churn labels.
+        n_splits (int): Number of stratified folds.
+        n_jobs (int): Number of worker processes; -1 uses all CPU cores.
+        random_state (int): Seed for shuffling the folds.
+        threshold (float): Decision threshold for F1, precision and recall.
+        fit (callable, optional): A picklable ``fit(model, X_train, y_train)`` used
+            instead of ``model.fit`` to train each fold.
+
+    Returns:
+        dict: Per-fold metrics under ``folds`` and their ``mean`` and ``std``.
+    """
+    # Share the cores between the concurrently running folds so that CV uses the
+    # whole machine without oversubscribing it.
+    if "n_jobs" in estimator.get_params():
+        n_cpus = cpu_count()
+        n_workers = n_jobs if n_jobs > 0 else max(1, n_cpus + 1 + n_jobs)
+        threads = max(1, n_cpus // min(n_splits, n_workers))
+        estimator = clone(estimator).set_params(n_jobs=threads)
+
+    splitter = StratifiedKFold(
+        n_splits=n_splits, shuffle=True, random_state=random_state
+    )
+    fold_metrics = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_and_score)(estimator, X, y, train_idx, val_idx, threshold, fit)
+        for train_idx, val_idx in splitter.split(X, y)
+    )
+
+    summary = pd.DataFrame(fold_metrics)
+    return {
+        "folds": fold_metrics,
+        "mean": summary.mean().to_dict(),
+        "std": summary.std(ddof=0).to_dict(),
+    }
+
+
+def plot_pr_curve(curve: dict, pr_auc: float, output_path="pr_curve.png") -> str:
+    """
+    Renders a precision-recall curve to disk.
+
+    Matplotlib is imported lazily so evaluation does not depend on it. The figure is
+    drawn on its own Agg canvas, leaving the process-wide backend untouched.
+
+    Returns:
+        str: The path of the saved figure.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.plot(curve["recall"], curve["precision"], label=f"PR AUC = {pr_auc:.2f}")
+    ax.set_title("Precision-Recall Curve")
+    ax.set_xlabel("Recall")
+    ax.set_ylabel("Precision")
+    ax.legend()
+    fig.savefig(output_path)
+    return output_path
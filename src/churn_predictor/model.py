@@ -4,9 +4,10 @@ import joblib
 import lightgbm as lgb
 import pandas as pd
 import yaml
-from sklearn.metrics import f1_score, precision_score, recall_score, roc_auc_score
 from sklearn.model_selection import train_test_split
 
+from src.churn_predictor.evaluation import compute_metrics, cross_validate
+
 
 class ChurnModel:
     """
@@ -33,8 +34,7 @@ class ChurnModel:
         joblib.dump(list(X.columns), os.path.join(features_dir, "feature_list.joblib"))
 
         # Handle class imbalance
-        scale_pos_weight = y.value_counts()[0] / y.value_counts()
-        self.model_params["scale_pos_weight"] = scale_pos_weight
+        self.model_params["scale_pos_weight"] = self._scale_pos_weight(y)
 
         return train_test_split(
             X,
@@ -44,6 +44,44 @@ class ChurnModel:
             stratify=y,
         )
 
+    @staticmethod
+    def _scale_pos_weight(y: pd.Series) -> float:
+        """Ratio of negative to positive samples, used to weight the churn class."""
+        counts = y.value_counts()
+        return counts[0] / counts[1]
+
+    def _fit(self, model, X_train, y_train, X_val, y_val, verbose=True):
+        """Fits a LightGBM model with early stopping on the validation set."""
+        model.fit(
+            X_train,
+            y_train,
+            eval_set=[(X_val, y_val)],
+            eval_metric="auc",
+            callbacks=[
+                lgb.early_stopping(
+                    self.config["training"]["early_stopping_rounds"],
+                    verbose=verbose,
+                )
+            ],
+        )
+        return model
+
+    def _fit_fold(self, model, X: pd.DataFrame, y: pd.Series):
+        """
+        Fits a cross-validation fold the same way ``train`` fits the final model:
+        class weighting from the fold's labels and early stopping on a stratified
+        split held out from the fold's training data.
+        """
+        model.set_params(scale_pos_weight=self._scale_pos_weight(y))
+        X_train, X_val, y_train, y_val = train_test_split(
+            X,
+            y,
+            test_size=self.config["training"]["test_size"],
+            random_state=self.config["training"]["random_state"],
+            stratify=y,
+        )
+        return self._fit(model, X_train, y_train, X_val, y_val, verbose=False)
+
     def train(self, df: pd.DataFrame):
         """
         Trains the LightGBM model.
@@ -56,17 +94,7 @@ class ChurnModel:
         self.model = lgb.LGBMClassifier(**self.model_params)
 
         print("Starting model training...")
-        self.model.fit(
-            X_train,
-            y_train,
-            eval_set=[(X_val, y_val)],
-            eval_metric="auc",
-            callbacks=[
-                lgb.early_stopping(
-                    self.config["training"]["early_stopping_rounds"], verbose=True
-                )
-            ],
-        )
+        self._fit(self.model, X_train, y_train, X_val, y_val)
         print("Model training complete.")
         self.save_model()
 
@@ -75,21 +103,40 @@ class ChurnModel:
         Evaluates the model on the validation set.
 
         Returns:
-            dict: A dictionary of evaluation metrics.
+            dict: A dictionary of evaluation metrics, including the F1-optimal
+                decision threshold.
         """
         if not self.model:
             raise ValueError("Model has not been trained yet.")
 
         y_pred_proba = self.model.predict_proba(X_val)[:, 1]
-        y_pred = (y_pred_proba > 0.5).astype(int)
-
-        metrics = {
-            "AUC_ROC": roc_auc_score(y_val, y_pred_proba),
-            "F1_Score": f1_score(y_val, y_pred),
-            "Precision": precision_score(y_val, y_pred),
-            "Recall": recall_score(y_val, y_pred),
-        }
-        return metrics
+        return compute_metrics(y_val, y_pred_proba)
+
+    def cross_validate(self, df: pd.DataFrame) -> dict:
+        """
+        Evaluates the model configuration with stratified k-fold cross-validation,
+        running the folds in parallel processes. Each fold is fitted like ``train``,
+        with class weighting and early stopping, independent of prior calls.
+
+        Args:
+            df (pd.DataFrame): The processed user features dataframe.
+
+        Returns:
+            dict: Per-fold metrics and their mean and standard deviation.
+        """
+        X = df.drop(columns=["userId", "churn"])
+        y = df["churn"]
+        eval_config = self.config["evaluation"]
+
+        return cross_validate(
+            lgb.LGBMClassifier(**self.model_params),
+            X,
+            y,
+            n_splits=eval_config["cv_folds"],
+            n_jobs=eval_config["n_jobs"],
+            random_state=self.config["training"]["random_state"],
+            fit=self._fit_fold,
+        )
 
     def predict(self, input_data: pd.DataFrame) -> tuple[int, float]:
         """
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import (
+    auc,
+    f1_score,
+    precision_recall_curve,
+    precision_score,
+    recall_score,
+    roc_auc_score,
+)
+
+from src.churn_predictor.evaluation import compute_metrics, cross_validate
+
+
+@pytest.fixture(scope="module")
+def scored_sample():
+    """Provides labels and scores with tied values for metric testing."""
+    rng = np.random.default_rng(42)
+    y_true = rng.integers(0, 2, size=500)
+    y_score = np.round(np.clip(y_true * 0.3 + rng.random(500) * 0.7, 0, 1), 2)
+    return y_true, y_score
+
+
+def test_compute_metrics_matches_sklearn(scored_sample):
+    """Test the single-sort metrics against the per-metric sklearn functions."""
+    y_true, y_score = scored_sample
+    y_pred = (y_score > 0.5).astype(int)
+
+    metrics = compute_metrics(y_true, y_score)
+
+    precision_vals, recall_vals, _ = precision_recall_curve(y_true, y_score)
+
+    assert metrics["AUC_ROC"] == pytest.approx(roc_auc_score(y_true, y_score))
+    assert metrics["PR_AUC"] == pytest.approx(auc(recall_vals, precision_vals))
+    assert metrics["F1_Score"] == pytest.approx(f1_score(y_true, y_pred))
+    assert metrics["Precision"] == pytest.approx(precision_score(y_true, y_pred))
+    assert metrics["Recall"] == pytest.approx(recall_score(y_true, y_pred))
+
+
+def test_compute_metrics_best_threshold(scored_sample):
+    """Test that the threshold sweep finds the F1-optimal cut-off."""
+    y_true, y_score = scored_sample
+
+    metrics = compute_metrics(y_true, y_score)
+
+    brute_force = max(
+        f1_score(y_true, (y_score >= t).astype(int)) for t in np.unique(y_score)
+    )
+    assert metrics["Best_F1_Score"] == pytest.approx(brute_force)
+    best_pred = (y_score > metrics["Best_Threshold"]).astype(int)
+    assert f1_score(y_true, best_pred) == pytest.approx(brute_force)
+    assert metrics["Best_F1_Score"] >= metrics["F1_Score"]
+
+
+@pytest.mark.parametrize(
+    "y_true, y_score",
+    [
+        ([0, 1, 1, 0], [0.5, 0.5, 0.9, 0.1]),
+        ([1, 1, 0, 1], [0.2, 0.2, 0.1, 0.05]),
+    ],
+)
+def test_best_threshold_round_trip(y_true, y_score):
+    """Test that applying Best_Threshold reproduces Best_F1_Score."""
+    metrics = compute_metrics(y_true, y_score)
+
+    applied = compute_metrics(y_true, y_score, threshold=metrics["Best_Threshold"])
+
+    assert applied["F1_Score"] == pytest.approx(metrics["Best_F1_Score"])
+
+
+def test_compute_metrics_single_class():
+    """Test that metrics are rejected when only one class is present."""
+    with pytest.raises(ValueError):
+        compute_metrics([1, 1, 1], [0.2, 0.6, 0.9])
+
+
+def test_cross_validate_report(scored_sample):
+    """Test that cross-validation returns per-fold metrics and a summary."""
+    y_true, y_score = scored_sample
+    X = pd.DataFrame({"score": y_score})
+    y = pd.Series(y_true)
+
+    report = cross_validate(LogisticRegression(), X, y, n_splits=3, n_jobs=2)
+
+    sequential = cross_validate(LogisticRegression(), X, y, n_splits=3, n_jobs=1)
+
+    assert len(report["folds"]) == 3
+    assert set(report["mean"]) == set(report["folds"][0])
+    for fold, sequential_fold in zip(report["folds"], sequential["folds"]):
+        assert fold == pytest.approx(sequential_fold)
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+from src.churn_predictor.model import ChurnModel
+
+
+@pytest.fixture
+def churn_model(tmp_path):
+    """Provides a ChurnModel with a small, fast configuration."""
+    with open("configs/config.yaml", "r") as f:
+        config = yaml.safe_load(f)
+    config["model"]["save_path"] = str(tmp_path / "lgbm_churn_model.pkl")
+    config["params"].update(n_estimators=50, n_jobs=1)
+    config["training"]["early_stopping_rounds"] = 5
+    config["evaluation"].update(cv_folds=3, n_jobs=2)
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump(config))
+    return ChurnModel(config_path=str(config_path))
+
+
+@pytest.fixture
+def user_features():
+    """Provides an imbalanced synthetic user features dataframe."""
+    rng = np.random.default_rng(42)
+    n_users = 300
+    churn = (rng.random(n_users) < 0.2).astype(int)
+    return pd.DataFrame(
+        {
+            "userId": np.arange(n_users),
+            "tenure": rng.normal(100, 20, n_users) - churn * 30,
+            "num_thumbs_down": rng.poisson(2 + churn * 3),
+            "num_sessions": rng.poisson(20, n_users),
+            "churn": churn,
+        }
+    )
+
+
+def test_cross_validate_report(churn_model, user_features):
+    """Test that ChurnModel.cross_validate scores every configured fold."""
+    report = churn_model.cross_validate(user_features)
+
+    assert len(report["folds"]) == 3
+    assert 0.5 < report["mean"]["AUC_ROC"] <= 1.0
+
+
+def test_cross_validate_independent_of_train(churn_model, user_features):
+    """Test that cross-validation does not depend on whether train() ran first."""
+    before = churn_model.cross_validate(user_features)
+
+    churn_model.train(user_features)
+    after = churn_model.cross_validate(user_features)
+
+    for fold_after, fold_before in zip(after["folds"], before["folds"]):
+        assert fold_after == pytest.approx(fold_before)